@@ -1,28 +1,67 @@
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 from urllib.parse import quote_plus
 from io import StringIO
 from dataclasses import dataclass
+from functools import cached_property
+from http.cookiejar import Cookie
 
+import numpy as np
 import pandas as pd
 import pytz
 import requests
+from lxml import html as lh
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar, create_cookie
+from urllib3.util.retry import Retry
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
 
-@dataclass
+def _extract_csv_text(response: requests.Response) -> str:
+    """Strip the HTML wrapper from a streamed Canvas listjobs response, leaving the CSV text."""
+    # Parse straight from the socket so the body is never held as a separate str
+    response.raw.decode_content = True
+    # huge_tree: without it libxml2 silently drops text nodes over 10 MB
+    parser = lh.HTMLParser(encoding=response.encoding, huge_tree=True)
+    root = lh.parse(response.raw, parser=parser).getroot()
+    if root is None:
+        return ""
+    return root.text_content().strip()
+
+
+def _read_listjobs_csv(session: "CanvasSession", url: str, **read_csv_kwargs) -> Optional[pd.DataFrame]:
+    """
+    Fetch a Canvas listjobs export and parse the CSV embedded in its HTML.
+    Returns None when the page carries no CSV text.
+    """
+    with session.get(url, stream=True) as response:
+        cleaned_text = _extract_csv_text(response)
+    if not cleaned_text:
+        return None
+    return pd.read_csv(StringIO(cleaned_text), engine="c", **read_csv_kwargs)
+
+
+@dataclass(frozen=True)
 class DateRange:
     """Represents a date range with formatting utilities."""
     start: datetime
     end: datetime
     
-    def format(self, fmt: str = "%m/%d/%Y") -> Tuple[str, str]:
-        """Format start and end dates."""
+    DEFAULT_FORMAT = "%m/%d/%Y"
+    
+    @cached_property
+    def _default_formatted(self) -> Tuple[str, str]:
+        return self.start.strftime(self.DEFAULT_FORMAT), self.end.strftime(self.DEFAULT_FORMAT)
+    
+    def format(self, fmt: str = DEFAULT_FORMAT) -> Tuple[str, str]:
+        """Format start and end dates (the default format is memoized per range)."""
+        if fmt == self.DEFAULT_FORMAT:
+            return self._default_formatted
         return self.start.strftime(fmt), self.end.strftime(fmt)
     
     def get_last_year(self) -> 'DateRange':
@@ -38,35 +77,53 @@ class CanvasSession:
     
     COOKIE_PATH = "canvas_cookies.json"
     BASE_URL = "https://canvas.artofdrawers.com"
-    
-    def __init__(self):
-        self.session = self._create_session()
-    
-    def _create_session(self) -> requests.Session:
-        """Create authenticated session with Canvas cookies."""
-        try:
-            with open(self.COOKIE_PATH, "r") as f:
-                raw_cookies = json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Cookie file not found: {self.COOKIE_PATH}")
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+    RETRY_STATUSES = (502, 503, 504)
+    
+    def __init__(self, raw_cookies: Optional[List[Dict[str, Any]]] = None):
+        self.session = self._create_session(raw_cookies)
+    
+    def _create_session(self, raw_cookies: Optional[List[Dict[str, Any]]] = None) -> requests.Session:
+        """Create authenticated session with Canvas cookies (read from COOKIE_PATH if not given)."""
+        if raw_cookies is None:
+            try:
+                with open(self.COOKIE_PATH, "r") as f:
+                    raw_cookies = json.load(f)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Cookie file not found: {self.COOKIE_PATH}")
         
         session = requests.Session()
-        for cookie in raw_cookies:
-            params = {
-                key: cookie[key] for key in ["domain", "path", "secure"] 
-                if key in cookie
-            }
-            if "expirationDate" in cookie:
-                params["expires"] = int(cookie["expirationDate"])
-            
-            session.cookies.set(
-                cookie["name"], 
-                cookie["value"], 
-                **params
-            )
+        
+        # Keep-alive pool sized for the report's concurrent fetches; GETs retry on gateway errors
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=self.RETRY_STATUSES)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+        
+        jar = RequestsCookieJar()
+        for raw in raw_cookies:
+            jar.set_cookie(self._to_cookie(raw))
+        session.cookies = jar
         
         return session
     
+    @staticmethod
+    def _to_cookie(cookie: Dict[str, Any]) -> Cookie:
+        """Convert a Cookie-Editor export entry into a cookiejar Cookie."""
+        params = {
+            key: cookie[key] for key in ["domain", "path", "secure"] 
+            if key in cookie
+        }
+        if "expirationDate" in cookie:
+            params["expires"] = int(cookie["expirationDate"])
+        
+        return create_cookie(cookie["name"], cookie["value"], **params)
+    
     def get(self, url: str, **kwargs) -> requests.Response:
         """Make authenticated GET request."""
         response = self.session.get(url, **kwargs)
@@ -92,49 +149,51 @@ class JobsStatusScraper:
     https://canvas.artofdrawers.com/listjobs.html?dsraas=1&id=&location_id=&zone=&zone_id=&production_priority_ge=&production_priority_le=&opportunity=&opportunity_id=&customer=&customer_id=&campaign_source=&customer_id_sub_filters_campaign_source_id=&customer_id_sub_filters_firstname=&customer_id_sub_filters_lastname=&customer_id_sub_filters_spouse=&customer_id_sub_filters_preferred_phone=&customer_id_sub_filters_cell_phone=&customer_id_sub_filters_emailaddr=&city=&state_id=&country_id=&latitude_ge=&latitude_le=&longitude_ge=&longitude_le=&location_tax_rate_id=&total_cost_ge=&total_cost_le=&material_total_ge=&material_total_le=&labor_total_ge=&labor_total_le=&delivery_total_ge=&delivery_total_le=&discount_total_ge=&discount_total_le=&credit_memo_total_ge=&credit_memo_total_le=&tax_total_ge=&tax_total_le=&order_total_ge=&order_total_le=&amount_paid_ge=&amount_paid_le=&amount_due_ge=&amount_due_le=&designer_id=&tma_id=&relationship_partner_id=&installer_id=&shipping_type_id=&number_of_items_ge=&number_of_items_le=&manufacturing_batch_id=&manufacturing_facility_id=&manufacturing_status_id=&date_submitted_to_manufacturing_ge=&date_submitted_to_manufacturing_le=&date_submitted_to_manufacturing_r=select&number_of_days_ago_submitted_to_go_ge=&number_of_days_ago_submitted_to_go_le=&number_of_biz_days_at_manufacturing_status_ge=&number_of_biz_days_at_manufacturing_status_le=&date_submitted_to_manufacturing_partner_ge=&date_submitted_to_manufacturing_partner_le=&date_submitted_to_manufacturing_partner_r=select&date_projected_to_ship_ge=&date_projected_to_ship_le=&date_projected_to_ship_r=select&date_shipped_ge=&date_shipped_le=&date_shipped_r=select&carrier_id=&tracking_number=&date_delivered_ge=&date_delivered_le=&date_delivered_r=select&commission_rate_type_id=&designer_commission_override_percentage_ge=&designer_commission_override_percentage_le=&tma_commission_rate_type_id=&tma_commission_has_been_paid_y=y&tma_commission_has_been_paid_n=n&job_type_id=&current_status_ids%5B%5D=2&current_status_ids%5B%5D=3&current_status_ids%5B%5D=5&current_status_ids%5B%5D=6&current_status_ids%5B%5D=7&current_status_ids%5B%5D=8&current_status_ids%5B%5D=9&current_status_ids%5B%5D=10&current_status_ids%5B%5D=11&current_status_ids%5B%5D=12&current_status_ids%5B%5D=13&current_status_ids%5B%5D=21&current_status_ids%5B%5D=22&current_status_ids%5B%5D=23&current_status_ids%5B%5D=24&current_status_ids%5B%5D=25&current_status_ids%5B%5D=30&current_status_ids%5B%5D=31&current_status_ids%5B%5D=33&current_status_ids%5B%5D=34&current_status_ids%5B%5D=37&current_status_ids%5B%5D=38&date_of_last_status_change_ge=&date_of_last_status_change_le=&date_of_last_status_change_r=select&promotion_id=&date_placed_ge=&date_placed_le=&date_placed_r=select&date_of_initial_appointment_ge=&date_of_initial_appointment_le=&date_of_initial_appointment_r=select&date_of_welcome_call_ge=&date_of_welcome_call_le=&date_of_welcome_call_r=select&date_measurements_scheduled_ge=&date_measurements_scheduled_le=&date_measurements_scheduled_r=select&date_installation_scheduled_ge=&date_installation_scheduled_le=&date_installation_scheduled_r=select&date_of_final_payment_ge=&date_of_final_payment_le=&date_of_final_payment_r=select&date_completed_ge=&date_completed_le=&date_completed_r=select&date_last_payment_ge=&date_last_payment_le=&date_last_payment_r=select&payment_type_id=&memo=&payment_value_lookup=&time_est=&job_survey_response_id=&is_rush_y=y&is_rush_n=n&rush_is_billable_y=y&rush_is_billable_n=n&is_split_order_y=y&is_split_order_n=n&exclude_from_close_rate_y=y&exclude_from_close_rate_n=n&exclude_from_average_sale_y=y&exclude_from_average_sale_n=n&number_of_basics_ge=&number_of_basics_le=&number_of_classics_ge=&number_of_classics_le=&number_of_designers_ge=&number_of_designers_le=&number_of_shelves_ge=&number_of_shelves_le=&number_of_dividers_ge=&number_of_dividers_le=&number_of_accessories_ge=&number_of_accessories_le=&number_of_strip_mounts_ge=&number_of_strip_mounts_le=&number_of_other_ge=&number_of_other_le=&number_of_options_ge=&number_of_options_le=&nps_survey_rating_ge=&nps_survey_rating_le=&wm_note=&active_y=y&date_last_modified_ge=&date_last_modified_le=&date_last_modified_r=select&date_added_ge=&date_added_le=&date_added_r=select&status_field_name_for_filter=REPLACE_STATUS&status_update_search_date_ge=REPLACE_START&status_update_search_date_le=REPLACE_END&status_update_search_date_r=select&sort_by=id&sort_dir=DESC&display=on&c%5B%5D=id&c%5B%5D=location_id&filter=Submit
     """.strip()
     
+    # Placeholders turned into format fields once, so building a URL is a single pass
+    URL_TEMPLATE_FMT = (
+        URL_TEMPLATE
+        .replace("REPLACE_STATUS", "{status}")
+        .replace("REPLACE_START", "{start}")
+        .replace("REPLACE_END", "{end}")
+    )
+    
     def __init__(self, session: CanvasSession):
         self.session = session
+        self._status_data: Dict[Tuple[str, int, DateRange], pd.DataFrame] = {}
     
     def _build_url(self, status_filter_id: int, date_range: DateRange) -> str:
         """Build the jobs listing URL with parameters."""
         start_str, end_str = date_range.format()
-        return (
-            self.URL_TEMPLATE
-            .replace("REPLACE_STATUS", str(status_filter_id))
-            .replace("REPLACE_START", quote_plus(start_str))
-            .replace("REPLACE_END", quote_plus(end_str))
-        )
-    
-    def _classify_order_type(self, order_id: str) -> str:
-        """Classify order type based on ID pattern."""
-        if not isinstance(order_id, str):
-            return "New"
-        
-        if order_id.startswith("C"):
-            return "Claim"
-        elif order_id.startswith("R"):
-            return "Reorder"
-        elif re.match(r"^\d", order_id):
-            return "New"
-        
-        return "New"
+        return self.URL_TEMPLATE_FMT.format_map({
+            "status": status_filter_id,
+            "start": quote_plus(start_str),
+            "end": quote_plus(end_str),
+        })
     
     def _fetch_status_data(self, status_name: str, status_filter_id: int, date_range: DateRange) -> pd.DataFrame:
+        """Fetch job status data, reusing earlier fetches for the same status and range."""
+        key = (status_name, status_filter_id, date_range)
+        if key not in self._status_data:
+            self._status_data[key] = self._download_status_data(status_name, status_filter_id, date_range)
+        return self._status_data[key]
+    
+    def _download_status_data(self, status_name: str, status_filter_id: int, date_range: DateRange) -> pd.DataFrame:
         """Fetch and parse job status data."""
         url = self._build_url(status_filter_id, date_range)
-        response = self.session.get(url)
         
-        # Clean HTML tags from response
-        cleaned_text = re.sub(r"<[^>]+>", "", response.text).strip()
-        if not cleaned_text:
+        # Parse only the columns we report on (header case varies between statuses)
+        date_column_name = f"{status_name} Date".lower()
+        wanted_columns = {"id", "franchisee", date_column_name}
+        df = _read_listjobs_csv(
+            self.session,
+            url,
+            usecols=lambda col: col.lower() in wanted_columns,
+            dtype={"ID": "string", "Franchisee": "category"}
+        )
+        if df is None:
             return pd.DataFrame()
         
-        # Parse CSV data
-        df = pd.read_csv(StringIO(cleaned_text), engine="python")
-        df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
-        
         # Find date column
-        date_column_name = f"{status_name} Date".lower()
         date_column = next(
             (col for col in df.columns if col.lower() == date_column_name), 
             None
@@ -143,7 +202,14 @@ class JobsStatusScraper:
         # Add metadata columns
         df["Status"] = status_name
         df["Date"] = df[date_column] if date_column else pd.NaT
-        df["Order Type"] = df["ID"].apply(self._classify_order_type)
+        
+        # Classify order type from the ID prefix: C = claim, R = reorder, anything else is new
+        ids = df["ID"].astype(str)
+        df["Order Type"] = np.select(
+            [ids.str.startswith("C"), ids.str.startswith("R")],
+            ["Claim", "Reorder"],
+            default="New"
+        )
         
         return df[["ID", "Order Type", "Franchisee", "Date", "Status"]]
     
@@ -163,11 +229,13 @@ class JobsStatusScraper:
             filename = f"{start_str.replace('/', '')}_{end_str.replace('/', '')}_jobs.csv"
             output_path = Path("Reports") / filename
         
-        dataframes = []
-        for status_name, status_filter_id in self.STATUS_FILTERS.items():
-            df = self._fetch_status_data(status_name, status_filter_id, date_range)
-            if not df.empty:
-                dataframes.append(df)
+        # Statuses are fetched concurrently; map() keeps STATUS_FILTERS order in the output
+        with ThreadPoolExecutor(max_workers=len(self.STATUS_FILTERS)) as executor:
+            results = executor.map(
+                lambda item: self._fetch_status_data(item[0], item[1], date_range),
+                self.STATUS_FILTERS.items()
+            )
+            dataframes = [df for df in results if not df.empty]
         
         if not dataframes:
             return pd.DataFrame()
@@ -188,11 +256,17 @@ class ConversionReportDownloader:
         self.session = session
         self.form_url = f"{session.BASE_URL}/scripts/lead-to-appointment-conversion/index.html"
         self.csv_url = f"{session.BASE_URL}/scripts/report_as_spreadsheet.html?report=report_lead_to_appointment_conversion"
+        self._reports: Dict[Tuple[str, str], pd.DataFrame] = {}
     
     def download_report(self, date_range: DateRange) -> pd.DataFrame:
-        """Download conversion report for specified date range."""
-        start_str, end_str = date_range.format()
-        
+        """Download conversion report for specified date range, reusing earlier downloads."""
+        key = date_range.format()
+        if key not in self._reports:
+            self._reports[key] = self._fetch_report(*key)
+        return self._reports[key]
+    
+    def _fetch_report(self, start_str: str, end_str: str) -> pd.DataFrame:
+        """Submit the report form and download the resulting CSV."""
         # Submit form to set parameters
         payload = {
             "start_date": start_str,
@@ -233,6 +307,7 @@ class PDFReportGenerator:
     def __init__(self, output_dir: Path = Path("Reports")):
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.styles = getSampleStyleSheet()
     
     def _format_yoy_stat(self, label: str, current: float, last_year: float, is_currency: bool = False) -> str:
         """Format year-over-year statistic with percentage change."""
@@ -289,7 +364,6 @@ class PDFReportGenerator:
         output_path = self.output_dir / filename
         
         # Prepare content
-        styles = getSampleStyleSheet()
         story = []
         
         title = f"AoD Weekly Newsletter – {pull_date}"
@@ -318,12 +392,16 @@ class PDFReportGenerator:
             top3 = data["top3_locations"]
             content_lines.append("")  # blank line
             content_lines.append("<b>Top 3 Locations by Revenue:</b>")
-            for _, row in top3.iterrows():
-                content_lines.append(f"{row['Rank']}. {row['Location']} – ${row['Revenue']:,.2f}")
+            content_lines.extend([
+                f"{rank}. {location} – ${revenue:,.2f}"
+                for rank, location, revenue in zip(
+                    top3["Rank"].to_numpy(), top3["Location"].to_numpy(), top3["Revenue"].to_numpy()
+                )
+            ])
         
         # Add content to PDF
         for line in content_lines:
-            story.append(Paragraph(line, styles['Normal']))
+            story.append(Paragraph(line, self.styles['Normal']))
             story.append(Spacer(1, 12))
         
         # Build PDF
@@ -349,46 +427,26 @@ class NetworkRevenue:
     
     def _parse_revenue_table(self, html: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Parse revenue table from HTML response."""
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
-            raise ImportError("BeautifulSoup4 is required for HTML parsing. Install with: pip install beautifulsoup4")
-        
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find_all("table")[-1]  # Use the last table on the page
-        
-        rows = []
-        total_row = None
-        
-        for tr in table.find_all("tr"):
-            cols = tr.find_all("td")
-            if len(cols) != 3:
-                continue
-            
-            rank, name, revenue = [td.text.strip() for td in cols]
-            
-            # Clean revenue value
-            revenue_clean = float(revenue.replace("$", "").replace(",", ""))
-            
-            if name.lower() == "total":
-                total_row = {
-                    "Rank": rank,
-                    "Location": name,
-                    "Revenue": revenue_clean
-                }
-            else:
-                rows.append({
-                    "Rank": int(rank),
-                    "Location": name,
-                    "Revenue": revenue_clean
-                })
-        
-        if total_row is None:
+        df = pd.read_html(StringIO(html), flavor="lxml")[-1]  # Use the last table on the page
+        if df.shape[1] != 3:
+            raise ValueError(f"Unexpected revenue table layout: {list(df.columns)}")
+        
+        df.columns = ["Rank", "Location", "Revenue"]
+        
+        # Clean revenue values; rows without a numeric revenue (spacers, headings) are dropped
+        revenue = pd.to_numeric(
+            df["Revenue"].astype(str).str.replace(r"[$,]", "", regex=True),
+            errors="coerce"
+        )
+        df = df.assign(Revenue=revenue).dropna(subset=["Location", "Revenue"])
+        
+        is_total = df["Location"].astype(str).str.lower().eq("total")
+        if not is_total.any():
             raise ValueError("Could not find total row in revenue table.")
         
-        df_all = pd.DataFrame(rows)
-        df_top3 = df_all.nlargest(3, "Revenue").copy() if not df_all.empty else pd.DataFrame()
-        df_total = pd.DataFrame([total_row])
+        df_all = df[~is_total].astype({"Rank": int})
+        df_top3 = df_all.nlargest(3, "Revenue")  # keeps its columns even when empty
+        df_total = df[is_total].tail(1).reset_index(drop=True)
         
         return df_total, df_top3
     
@@ -413,20 +471,28 @@ class NetworkRevenue:
 
 class MeasurementShippedScraper:
     
+    DATE_FORMAT = "%m/%d/%Y"
+    NS_PER_DAY = 86_400 * 10**9
+    
     URL_TEMPLATE = """
     https://canvas.artofdrawers.com/listjobs.html?dsraas=1&id=&location_id=&location_id_sub_filters_exclude_from_reports_n=n&zone=&zone_id=&production_priority_ge=&production_priority_le=&opportunity=&opportunity_id=&customer=&customer_id=&campaign_source=&customer_id_sub_filters_campaign_source_id=&customer_id_sub_filters_firstname=&customer_id_sub_filters_lastname=&customer_id_sub_filters_spouse=&customer_id_sub_filters_preferred_phone=&customer_id_sub_filters_cell_phone=&customer_id_sub_filters_emailaddr=&city=&state_id=&country_id=&latitude_ge=&latitude_le=&longitude_ge=&longitude_le=&location_tax_rate_id=&total_cost_ge=&total_cost_le=&material_total_ge=&material_total_le=&labor_total_ge=&labor_total_le=&delivery_total_ge=&delivery_total_le=&discount_total_ge=&discount_total_le=&credit_memo_total_ge=&credit_memo_total_le=&tax_total_ge=&tax_total_le=&order_total_ge=&order_total_le=&amount_paid_ge=&amount_paid_le=&amount_due_ge=&amount_due_le=&siteuser=&designer_id=&tma_id=&relationship_partner_id=&installer_id=&shipping_type_id=&number_of_items_ge=&number_of_items_le=&manufacturing_batch_id=&manufacturing_facility_id=&manufacturing_status_id=&date_submitted_to_manufacturing_ge=&date_submitted_to_manufacturing_le=&date_submitted_to_manufacturing_r=select&number_of_days_ago_submitted_to_go_ge=&number_of_days_ago_submitted_to_go_le=&number_of_biz_days_at_manufacturing_status_ge=&number_of_biz_days_at_manufacturing_status_le=&date_submitted_to_manufacturing_partner_ge=&date_submitted_to_manufacturing_partner_le=&date_submitted_to_manufacturing_partner_r=select&date_projected_to_ship_ge=&date_projected_to_ship_le=&date_projected_to_ship_r=select&date_shipped_ge=REPLACE_START&date_shipped_le=REPLACE_END&date_shipped_r=select&carrier_id=&tracking_number=&date_delivered_ge=&date_delivered_le=&date_delivered_r=select&commission_rate_type_id=&designer_commission_override_percentage_ge=&designer_commission_override_percentage_le=&tma_commission_rate_type_id=&tma_commission_has_been_paid_y=y&tma_commission_has_been_paid_n=n&job_type_id=&%63urrent_status_ids%5B%5D=21&%63urrent_status_ids%5B%5D=22&%63urrent_status_ids%5B%5D=2&%63urrent_status_ids%5B%5D=3&%63urrent_status_ids%5B%5D=23&%63urrent_status_ids%5B%5D=5&%63urrent_status_ids%5B%5D=24&%63urrent_status_ids%5B%5D=33&%63urrent_status_ids%5B%5D=6&%63urrent_status_ids%5B%5D=34&%63urrent_status_ids%5B%5D=37&%63urrent_status_ids%5B%5D=38&%63urrent_status_ids%5B%5D=7&%63urrent_status_ids%5B%5D=8&%63urrent_status_ids%5B%5D=9&%63urrent_status_ids%5B%5D=30&%63urrent_status_ids%5B%5D=10&%63urrent_status_ids%5B%5D=11&%63urrent_status_ids%5B%5D=31&%63urrent_status_ids%5B%5D=25&%63urrent_status_ids%5B%5D=12&%63urrent_status_ids%5B%5D=13&date_of_last_status_change_ge=&date_of_last_status_change_le=&date_of_last_status_change_r=select&promotion_id=&date_placed_ge=&date_placed_le=&date_placed_r=select&date_of_initial_appointment_ge=&date_of_initial_appointment_le=&date_of_initial_appointment_r=select&date_of_welcome_call_ge=&date_of_welcome_call_le=&date_of_welcome_call_r=select&date_measurements_scheduled_ge=&date_measurements_scheduled_le=&date_measurements_scheduled_r=select&date_installation_scheduled_ge=&date_installation_scheduled_le=&date_installation_scheduled_r=select&date_of_final_payment_ge=&date_of_final_payment_le=&date_of_final_payment_r=select&date_completed_ge=&date_completed_le=&date_completed_r=select&date_last_payment_ge=&date_last_payment_le=&date_last_payment_r=select&payment_type_id=&memo=&payment_value_lookup=&time_est=&job_survey_response_id=&is_rush_y=y&is_rush_n=n&rush_is_billable_y=y&rush_is_billable_n=n&is_split_order_y=y&is_split_order_n=n&exclude_from_close_rate_y=y&exclude_from_close_rate_n=n&exclude_from_average_sale_y=y&exclude_from_average_sale_n=n&number_of_basics_ge=&number_of_basics_le=&number_of_classics_ge=&number_of_classics_le=&number_of_designers_ge=&number_of_designers_le=&number_of_shelves_ge=&number_of_shelves_le=&number_of_dividers_ge=&number_of_dividers_le=&number_of_accessories_ge=&number_of_accessories_le=&number_of_strip_mounts_ge=&number_of_strip_mounts_le=&number_of_other_ge=&number_of_other_le=&number_of_options_ge=&number_of_options_le=&nps_survey_rating_ge=&nps_survey_rating_le=&wm_note=&active_y=y&date_last_modified_ge=&date_last_modified_le=&date_last_modified_r=select&date_added_ge=&date_added_le=&date_added_r=select&status_field_name_for_filter=23&status_update_search_date_ge=&status_update_search_date_le=&status_update_search_date_r=inpast&sort_by=id&sort_dir=DESC&c%5B%5D=id&c%5B%5D=location_id&c%5B%5D=order_total&c%5B%5D=date_shipped&filter=Submit
     """.strip()
     
+    URL_TEMPLATE_FMT = (
+        URL_TEMPLATE
+        .replace("REPLACE_START", "{start}")
+        .replace("REPLACE_END",   "{end}")
+    )
+    
     def __init__(self, session: CanvasSession):
         self.session = session
     
     def _build_url(self, date_range: DateRange) -> str:
         start_str, end_str = date_range.format()
-        return (
-            self.URL_TEMPLATE
-            .replace("REPLACE_START", quote_plus(start_str))
-            .replace("REPLACE_END",   quote_plus(end_str))
-        )
+        return self.URL_TEMPLATE_FMT.format_map({
+            "start": quote_plus(start_str),
+            "end": quote_plus(end_str),
+        })
     
     # def measurement_to_shipped(self, date_range: DateRange) -> str:
     #     """Return average “measurement → shipped” as “X days, Y hours”."""
@@ -463,35 +529,50 @@ class MeasurementShippedScraper:
     #     hours = int((avg - days) * 24)
     #     return f"{days} days, {hours} hours"
 
+    def _parse_dates(self, values: pd.Series) -> pd.Series:
+        """
+        Parse Canvas date strings. Plain MM/DD/YYYY values take the fast
+        fixed-format path; anything else (e.g. values carrying a time) is
+        inferred per value so the time of day is kept.
+        """
+        parsed = pd.to_datetime(values, format=self.DATE_FORMAT, errors="coerce", cache=True)
+        remaining = parsed.isna() & values.notna()
+        if remaining.any():
+            parsed[remaining] = pd.to_datetime(values[remaining], format="mixed", errors="coerce", cache=True)
+        return parsed
+    
     def measurement_to_shipped(self, date_range: DateRange) -> Tuple[float,str]:
         """
         Returns (avg_days_float, human_str) where human_str is
         'X days, Y hours'.
         """
-        resp = self.session.get(self._build_url(date_range))
-        resp.raise_for_status()
-        cleaned = re.sub(r"<[^>]+>", "", resp.text).strip()
-        if not cleaned:
+        df = _read_listjobs_csv(
+            self.session,
+            self._build_url(date_range),
+            usecols=["Date Shipped", "Measurement Approved Date"]
+        )
+        if df is None:
             return 0.0, "No data"
-        df = pd.read_csv(StringIO(cleaned), engine="python")
-        df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
     
-        df["Date Shipped"] = pd.to_datetime(df["Date Shipped"], errors="coerce")
-        df["Measurement Approved Date"] = (
+        df["Date Shipped"] = self._parse_dates(df["Date Shipped"])
+        # Approval column may list several dates; the last one is the final approval
+        last_measurement = (
             df["Measurement Approved Date"]
-              .apply(lambda s: pd.to_datetime(s.split(",")[-1].strip(), errors="coerce"))
+              .astype("string")
+              .str.rsplit(",", n=1)
+              .str[-1]
+              .str.strip()
         )
+        df["Measurement Approved Date"] = self._parse_dates(last_measurement)
     
-        diffs = (
-            (df["Date Shipped"] - df["Measurement Approved Date"])
-            .dt.total_seconds()
-            .div(86400)
-            .dropna()
-        )
-        if diffs.empty:
+        # Average over rows where both dates parsed, on the raw datetime64 arrays
+        shipped = df["Date Shipped"].to_numpy(dtype="datetime64[ns]")
+        measured = df["Measurement Approved Date"].to_numpy(dtype="datetime64[ns]")
+        valid = ~(np.isnat(shipped) | np.isnat(measured))
+        if not valid.any():
             return 0.0, "No valid dates"
     
-        avg = diffs.mean()
+        avg = (shipped[valid] - measured[valid]).astype(np.int64).mean() / self.NS_PER_DAY
         days = int(avg)
         hours = int((avg - days) * 24)
         human = f"{days} days, {hours} hours"
@@ -503,14 +584,26 @@ class MeasurementShippedScraper:
 class WeeklyReportGenerator:
     """Main orchestrator for generating weekly reports."""
     
-    def __init__(self):
-        self.session = CanvasSession()
+    MAX_WORKERS = 8
+    
+    def __init__(self, raw_cookies: Optional[List[Dict[str, Any]]] = None):
+        self.session = CanvasSession(raw_cookies)
         self.jobs_scraper = JobsStatusScraper(self.session)
         self.conversion_downloader = ConversionReportDownloader(self.session)
         self.network_revenue = NetworkRevenue(self.session)
         self.meas_shipped_scraper  = MeasurementShippedScraper(self.session)
         self.pdf_generator = PDFReportGenerator()
     
+    def _get_ssc_touches(self, current_range: DateRange, last_year_range: DateRange) -> Tuple[int, int]:
+        """
+        Get outbound communications for both ranges.
+        The conversion report keeps its date range in the server-side session
+        between the form POST and the CSV download, so these must not overlap.
+        """
+        current = self.conversion_downloader.get_total_outbound_communications(current_range)
+        last_year = self.conversion_downloader.get_total_outbound_communications(last_year_range)
+        return current, last_year
+    
     def generate_report(self, days_back: int = 30) -> Path:
         """Generate complete weekly report."""
         # Setup date ranges
@@ -527,40 +620,57 @@ class WeeklyReportGenerator:
         
         print(f"Generating report for {current_range.format()[0]} to {current_range.format()[1]}")
 
-        # 1) revenue
-        revenue_current, top3_df   = self.network_revenue.get_revenue_summary(current_range)
-        revenue_last_year, _       = self.network_revenue.get_revenue_summary(last_year_range)
-
-        # 2) measurement→shipped
-        avg_cur, avg_cur_str       = self.meas_shipped_scraper.measurement_to_shipped(current_range)
-        avg_ly,  avg_ly_str        = self.meas_shipped_scraper.measurement_to_shipped(last_year_range)
-
-        # Collect all data
-        data = {
-            # SSC Touches
-            "ssc_current": self.conversion_downloader.get_total_outbound_communications(current_range),
-            "ssc_last_year": self.conversion_downloader.get_total_outbound_communications(last_year_range),
-            
-            # Orders Shipped
-            "shipped_current": self.jobs_scraper.count_jobs_by_status("Order Shipped", current_range),
-            "shipped_last_year": self.jobs_scraper.count_jobs_by_status("Order Shipped", last_year_range),
-            
-            # Orders Submitted
-            "submitted_current": self.jobs_scraper.count_jobs_by_status("Submitted to Manufacturing Partner", current_range),
-            "submitted_last_year": self.jobs_scraper.count_jobs_by_status("Submitted to Manufacturing Partner", last_year_range),
-
-            # Network Revenue
-            "revenue_current":   revenue_current,
-            "revenue_last_year": revenue_last_year,
-
-            # NEW metrics:
-            "avg_meas_current": avg_cur,
-            "avg_meas_lastyr":  avg_ly,
-
-            # now include the top-3 locations DataFrame
-            "top3_locations": top3_df,
+        # Every fetch is independent network I/O, so run them concurrently
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # 1) revenue
+            revenue_current_f   = executor.submit(self.network_revenue.get_revenue_summary, current_range)
+            revenue_last_year_f = executor.submit(self.network_revenue.get_revenue_summary, last_year_range)
+
+            # 2) measurement→shipped
+            avg_cur_f = executor.submit(self.meas_shipped_scraper.measurement_to_shipped, current_range)
+            avg_ly_f  = executor.submit(self.meas_shipped_scraper.measurement_to_shipped, last_year_range)
+
+            # 3) SSC touches
+            ssc_f = executor.submit(self._get_ssc_touches, current_range, last_year_range)
+
+            # 4) orders shipped / submitted
+            shipped_current_f     = executor.submit(self.jobs_scraper.count_jobs_by_status, "Order Shipped", current_range)
+            shipped_last_year_f   = executor.submit(self.jobs_scraper.count_jobs_by_status, "Order Shipped", last_year_range)
+            submitted_current_f   = executor.submit(self.jobs_scraper.count_jobs_by_status, "Submitted to Manufacturing Partner", current_range)
+            submitted_last_year_f = executor.submit(self.jobs_scraper.count_jobs_by_status, "Submitted to Manufacturing Partner", last_year_range)
+
+            revenue_current, top3_df = revenue_current_f.result()
+            revenue_last_year, _     = revenue_last_year_f.result()
+            avg_cur, avg_cur_str     = avg_cur_f.result()
+            avg_ly,  avg_ly_str      = avg_ly_f.result()
+            ssc_current, ssc_last_year = ssc_f.result()
+
+            # Collect all data
+            data = {
+                # SSC Touches
+                "ssc_current": ssc_current,
+                "ssc_last_year": ssc_last_year,
+                
+                # Orders Shipped
+                "shipped_current": shipped_current_f.result(),
+                "shipped_last_year": shipped_last_year_f.result(),
+                
+                # Orders Submitted
+                "submitted_current": submitted_current_f.result(),
+                "submitted_last_year": submitted_last_year_f.result(),
+
+                # Network Revenue
+                "revenue_current":   revenue_current,
+                "revenue_last_year": revenue_last_year,
+
+                # NEW metrics:
+                "avg_meas_current": avg_cur,
+                "avg_meas_lastyr":  avg_ly,
+
+                # now include the top-3 locations DataFrame
+                "top3_locations": top3_df,
 
-        }
+            }
         
         # Generate PDF
         output_path = self.pdf_generator.create_report(data, current_range, pull_date_str)